@@ -12,11 +12,71 @@ if sys.platform == "win32":
     import ctypes
     ctypes.windll.user32.ShowWindow(ctypes.windll.kernel32.GetConsoleWindow(), 0)
 
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from tkinter import font as tkfont
 from PIL import Image, ImageTk, ImageDraw, ImageFont
 import numpy as np
 
+# Optional Numba acceleration for the pixel-to-char gather on large images
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _gather_codes(arr, table, out):
+        """Parallel row-wise gather: out[y, x] = table[arr[y, x]].
+
+        First call pays a one-time JIT compilation cost; subsequent calls
+        run as native code across all cores.
+        """
+        for y in prange(arr.shape[0]):
+            for x in range(arr.shape[1]):
+                out[y, x] = table[arr[y, x]]
+
+# Crop presets as (start_x, start_y, end_x, end_y) percentages
+CROP_PRESETS = {
+    "center": (25.0, 25.0, 75.0, 75.0),
+    "top": (0.0, 0.0, 100.0, 50.0),
+    "bottom": (0.0, 50.0, 100.0, 100.0),
+    "left": (0.0, 0.0, 50.0, 100.0),
+    "right": (50.0, 0.0, 100.0, 100.0),
+    "reset": (0.0, 0.0, 100.0, 100.0),
+}
+
+@functools.lru_cache(maxsize=64)
+def _build_char_table(char_set, is_ascii, invert, brightness):
+    """Build the fused 256-entry gray-to-character table for one settings combo.
+
+    Memoized so repeated conversions with the same character set, invert
+    flag and brightness reuse the table instead of rebuilding it per frame.
+    """
+    g = np.clip(np.arange(256, dtype=np.int32) + brightness, 0, 255)
+    idx = g * (len(char_set) - 1) // 255
+    if invert:
+        idx = (len(char_set) - 1) - idx
+    if is_ascii:
+        return np.frombuffer(char_set.encode('ascii'), dtype=np.uint8)[idx]
+    return np.frombuffer(char_set.encode('utf-32-le'), dtype=np.uint32)[idx]
+
+@functools.lru_cache(maxsize=32)
+def _load_monospace_font(font_size):
+    """Load a monospace font for image export, caching one instance per size"""
+    for name in ("consola.ttf", "cour.ttf", "monaco.ttf", "DejaVuSansMono.ttf"):
+        try:
+            return ImageFont.truetype(name, font_size)
+        except (OSError, IOError):
+            continue
+    return ImageFont.load_default()
+
 class ImageToASCII:
     def __init__(self, root):
         self.root = root
@@ -58,8 +118,40 @@ class ImageToASCII:
             "custom": " .:-=+*#%@"
         }
         
+        # Pre-encoded character sets: ASCII bytes for the byte fast path,
+        # None for sets that need the unicode code-point path
+        self._char_sets_bytes = {
+            k: v.encode('ascii') if v.isascii() else None
+            for k, v in self.char_sets.items()
+        }
+
+        # Decoded grayscale source cache keyed by (path, mtime) so preview
+        # control changes don't re-read and re-decode the file every time
+        self._img_cache = {}
+
+        # Rendered ASCII cache keyed by (path, mtime, control values) so
+        # toggling a setting back and forth reuses the earlier result
+        self._ascii_cache = {}
+        self._last_preview_lines = None  # Lines currently shown in the preview
+        self._last_render_key = None  # Settings key of the render on screen
+        self._pending_update = None  # Handle of the scheduled preview update
+        self._status_job = None  # Handle of the scheduled status-line refresh
+        self._batch_vars = False  # Suppress updates during grouped var sets
+        self._insert_seq = 0  # Generation id for chunked preview inserts
+
+        # Reusable (rows, cols + 1) byte buffer with a baked-in newline
+        # column, so repeated same-size renders skip the per-row join
+        self._out_buf = None
+        self._out_buf_lock = threading.Lock()
+
+        # Worker pool for conversions; PIL and NumPy release the GIL in
+        # their C code, so the UI thread keeps running while they work
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._render_seq = 0  # Monotonic id used to drop stale renders
+        self._copy_seq = 0  # Monotonic id used to cancel stale clipboard chains
+
         self.setup_ui()
-        
+
     def setup_ui(self):
         """Setup the user interface"""
         # Main frame
@@ -174,12 +266,19 @@ class ImageToASCII:
         if not lines:
             return None
             
-        # Calculate image dimensions
+        # Calculate image dimensions from the real glyph advance rather than
+        # the old font_size // 2 guess, which oversized the canvas
         max_line_length = max(len(line) for line in lines) if lines else 0
         line_height = font_size + 2  # Add some padding
-        
-        # Create image
-        img_width = max_line_length * (font_size // 2)  # Approximate character width
+
+        font = _load_monospace_font(font_size)
+        try:
+            char_width = max(1, int(font.getlength('M') + 0.5))
+        except AttributeError:
+            # Bitmap fallback fonts may not support getlength
+            char_width = max(1, font_size // 2)
+
+        img_width = max_line_length * char_width
         img_height = len(lines) * line_height
         
         # Create image with background color
@@ -192,29 +291,9 @@ class ImageToASCII:
         else:
             bg_rgb = (0, 0, 0)  # Default to black
             
-        if bg_color.lower() == "transparent":
-            image = Image.new('RGBA', (img_width, img_height), bg_rgb)
-        else:
-            image = Image.new('RGB', (img_width, img_height), bg_rgb)
-            
-        draw = ImageDraw.Draw(image)
-        
-        # Try to use a monospace font
-        try:
-            font = ImageFont.truetype("consola.ttf", font_size)
-        except (OSError, IOError):
-            try:
-                font = ImageFont.truetype("cour.ttf", font_size)
-            except (OSError, IOError):
-                try:
-                    font = ImageFont.truetype("monaco.ttf", font_size)
-                except (OSError, IOError):
-                    try:
-                        # Try common system fonts
-                        font = ImageFont.truetype("DejaVuSansMono.ttf", font_size)
-                    except (OSError, IOError):
-                        font = ImageFont.load_default()
-        
+        if img_width <= 0 or img_height <= 0:
+            return None
+
         # Set text color
         if text_color.lower() == "white":
             text_rgb = (255, 255, 255)
@@ -225,13 +304,37 @@ class ImageToASCII:
         else:
             text_rgb = (255, 255, 255)  # Default to white
             
-        # Draw text
-        y_position = 0
-        for line in lines:
-            draw.text((0, y_position), line, font=font, fill=text_rgb)
-            y_position += line_height
-            
-        return image
+        # Pre-rasterize each distinct character once into a glyph atlas, then
+        # assemble the page with NumPy blits instead of a FreeType rendering
+        # call per line of text
+        cell_w = char_width
+        cell_h = line_height
+        unique_chars = sorted(set(ascii_text) - {'\n'} | {' '})
+        atlas = np.zeros((len(unique_chars), cell_h, cell_w), dtype=np.uint8)
+        for i, ch in enumerate(unique_chars):
+            tile = Image.new('L', (cell_w, cell_h), 0)
+            ImageDraw.Draw(tile).text((0, 0), ch, font=font, fill=255)
+            atlas[i] = np.asarray(tile, dtype=np.uint8)
+        char_ids = {ch: i for i, ch in enumerate(unique_chars)}
+
+        # Map every character cell to its glyph and unfold into a page-sized
+        # coverage mask
+        grid = np.array([[char_ids[ch] for ch in line.ljust(max_line_length)]
+                         for line in lines], dtype=np.intp)
+        alpha = atlas[grid].transpose(0, 2, 1, 3).reshape(img_height, img_width)
+
+        if bg_color.lower() == "transparent":
+            out = np.zeros((img_height, img_width, 4), dtype=np.uint8)
+            out[:, :, :3] = text_rgb
+            out[:, :, 3] = alpha
+            return Image.fromarray(out, 'RGBA')
+
+        # Blend glyph coverage between background and text colors
+        a = alpha[:, :, np.newaxis].astype(np.uint16)
+        fg = np.array(text_rgb, dtype=np.uint16)
+        bg = np.array(bg_rgb, dtype=np.uint16)
+        out = ((bg * (255 - a) + fg * a) // 255).astype(np.uint8)
+        return Image.fromarray(out, 'RGB')
         
     def export_as_image(self):
         """Export ASCII art as an image file"""
@@ -348,6 +451,9 @@ class ImageToASCII:
         if filename:
             self.image_path.set(filename)
             self.preview_enabled = False  # Reset preview state
+            self._img_cache.clear()
+            self._ascii_cache.clear()
+            self._last_render_key = None
             
     def on_width_entry_change(self, event=None):
         """Handle width entry field changes"""
@@ -387,113 +493,165 @@ class ImageToASCII:
         self.width_scale.set(width_value)
         self.height_scale.set(height_value)
             
-    def image_to_ascii(self, image_path, width_scale=None, height_scale=None, char_set=None, invert=None, brightness=None, crop_enabled=None, crop_start_x=None, crop_start_y=None, crop_end_x=None, crop_end_y=None):
-        """Convert image to ASCII art"""
-        if not os.path.exists(image_path):
-            return "Please select a valid image file."
-            
-        try:
-            # Load image and convert to grayscale
-            image = Image.open(image_path).convert('L')
-            
-            # Apply cropping if enabled
-            if crop_enabled is None:
-                crop_enabled = self.crop_enabled.get()
-            
-            if crop_enabled:
-                if crop_start_x is None:
-                    crop_start_x = self.crop_start_x.get()
-                if crop_start_y is None:
-                    crop_start_y = self.crop_start_y.get()
-                if crop_end_x is None:
-                    crop_end_x = self.crop_end_x.get()
-                if crop_end_y is None:
-                    crop_end_y = self.crop_end_y.get()
-                
-                # Convert percentages to pixel coordinates
-                start_x = int(image.width * crop_start_x / 100)
-                start_y = int(image.height * crop_start_y / 100)
-                end_x = int(image.width * crop_end_x / 100)
-                end_y = int(image.height * crop_end_y / 100)
-                
-                # Validate crop coordinates before applying
-                if start_x >= end_x or start_y >= end_y:
-                    # Invalid crop coordinates, skip cropping
-                    pass
-                else:
-                    # Ensure valid crop coordinates
-                    start_x = max(0, min(start_x, image.width - 1))
-                    start_y = max(0, min(start_y, image.height - 1))
-                    end_x = max(start_x + 1, min(end_x, image.width))
-                    end_y = max(start_y + 1, min(end_y, image.height))
-                    
-                    # Crop the image
-                    image = image.crop((start_x, start_y, end_x, end_y))
-            
-            # Apply brightness adjustment
-            if brightness is None:
-                brightness = self.brightness.get()
+    def _ascii_matrix(self, image_path, width_scale=None, height_scale=None, char_set=None, invert=None, brightness=None, crop_enabled=None, crop_start_x=None, crop_start_y=None, crop_end_x=None, crop_end_y=None):
+        """Run the conversion pipeline and return the mapped character matrix.
+
+        Returns (matrix, is_bytes): a uint8 array of ASCII codes when the
+        character set is pure ASCII, otherwise a uint32 array of code points.
+        """
+        # Load image and convert to grayscale, reusing the cached decode
+        # when the file hasn't changed since the last call
+        key = (image_path, os.path.getmtime(image_path))
+        image = self._img_cache.get(key)
+        if image is None:
+            image = Image.open(image_path)
+            # For JPEGs, draft mode tells libjpeg to decode luma only,
+            # skipping the chroma work the convert would throw away anyway.
+            # It is a no-op for other formats
+            image.draft('L', image.size)
+            image = image.convert('L')
+            self._img_cache.clear()
+            self._img_cache[key] = image
+        
+        # Apply cropping if enabled
+        if crop_enabled is None:
+            crop_enabled = self.crop_enabled.get()
+        
+        if crop_enabled:
+            if crop_start_x is None:
+                crop_start_x = self.crop_start_x.get()
+            if crop_start_y is None:
+                crop_start_y = self.crop_start_y.get()
+            if crop_end_x is None:
+                crop_end_x = self.crop_end_x.get()
+            if crop_end_y is None:
+                crop_end_y = self.crop_end_y.get()
             
-            if brightness != 0:
-                # Apply brightness adjustment
-                img_array = np.array(image)
-                img_array = img_array + brightness
-                img_array = np.clip(img_array, 0, 255)
-                image = Image.fromarray(img_array.astype('uint8'))
+            # Convert percentages to pixel coordinates
+            start_x = int(image.width * crop_start_x / 100)
+            start_y = int(image.height * crop_start_y / 100)
+            end_x = int(image.width * crop_end_x / 100)
+            end_y = int(image.height * crop_end_y / 100)
             
-            # Resize image
-            if width_scale is None:
-                width_scale = self.width_scale.get()
-            if height_scale is None:
-                height_scale = self.height_scale.get()
+            # Validate crop coordinates before applying
+            if start_x >= end_x or start_y >= end_y:
+                # Invalid crop coordinates, skip cropping
+                pass
+            else:
+                # Ensure valid crop coordinates
+                start_x = max(0, min(start_x, image.width - 1))
+                start_y = max(0, min(start_y, image.height - 1))
+                end_x = max(start_x + 1, min(end_x, image.width))
+                end_y = max(start_y + 1, min(end_y, image.height))
                 
-            # Calculate new dimensions maintaining original aspect ratio
-            new_width = int(image.width * width_scale / 100)
-            new_height = int(image.height * height_scale / 100)
-            
-            # Ensure minimum dimensions of 1x1
-            new_width = max(1, new_width)
-            new_height = max(1, new_height)
+                # Crop the image
+                image = image.crop((start_x, start_y, end_x, end_y))
+        
+        if brightness is None:
+            brightness = self.brightness.get()
+
+        # Resize image
+        if width_scale is None:
+            width_scale = self.width_scale.get()
+        if height_scale is None:
+            height_scale = self.height_scale.get()
             
-            # Use LANCZOS resampling with backward compatibility
+        # Calculate new dimensions maintaining original aspect ratio
+        new_width = int(image.width * width_scale / 100)
+        new_height = int(image.height * height_scale / 100)
+        
+        # Ensure minimum dimensions of 1x1
+        new_width = max(1, new_width)
+        new_height = max(1, new_height)
+        
+        # Pillow copies the full image even for an identity resize, so skip
+        # the whole resample when the size already matches
+        if (new_width, new_height) != image.size:
+            # For large downscales, do a cheap integer box-average first so
+            # the quality resample only touches a fraction of the source
+            if new_width < image.width and new_height < image.height:
+                factor = min(image.width // new_width, image.height // new_height)
+                if factor >= 2:
+                    image = image.reduce(factor)
+
+            # Use BOX resampling with backward compatibility. The output is
+            # quantized to a handful of gray levels anyway, so the area
+            # average is indistinguishable from LANCZOS here and much cheaper
             try:
-                image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                image = image.resize((new_width, new_height), Image.Resampling.BOX,
+                                     reducing_gap=3.0)
             except AttributeError:
                 # Fallback for older Pillow versions
-                image = image.resize((new_width, new_height), Image.LANCZOS)
-            
-            # Get character set
-            if char_set is None:
-                char_set = self.char_sets[self.char_set.get()]
-            else:
-                char_set = self.char_sets.get(char_set, self.char_sets["standard"])
-                
-            # Convert to ASCII efficiently
-            pixels = list(image.getdata())
-            
-            # Generate ASCII art
-            ascii_chars = []
-            for i in range(0, len(pixels), new_width):
-                row = pixels[i:i + new_width]
-                ascii_row = ""
-                for pixel in row:
-                    gray_value = pixel
-                    char_index = int(gray_value * (len(char_set) - 1) / 255)
-                    
-                    # Invert if requested
-                    if invert is None:
-                        invert = self.invert_colors.get()
-                    if invert:
-                        char_index = len(char_set) - 1 - char_index
-                        
-                    ascii_row += char_set[char_index]
-                ascii_chars.append(ascii_row)
-                
-            return "\n".join(ascii_chars)
-            
+                image = image.resize((new_width, new_height), Image.BOX)
+        
+        # Get character set
+        if char_set is None:
+            char_set_name = self.char_set.get()
+        else:
+            char_set_name = char_set if char_set in self.char_sets else "standard"
+        char_set = self.char_sets[char_set_name]
+        char_bytes = self._char_sets_bytes[char_set_name]
+
+        if invert is None:
+            invert = self.invert_colors.get()
+
+        # Brightness, inversion and gray-to-char quantization are fused into
+        # one memoized 256-entry table, so the conversion is a single gather
+        # over the image: uint8 ASCII codes for pure-ASCII sets, uint32 code
+        # points for the unicode ones (blocks, dots)
+        arr = np.asarray(image, dtype=np.uint8)
+        is_ascii = char_bytes is not None
+        lut = _build_char_table(char_set, is_ascii, bool(invert), int(brightness))
+        if HAVE_NUMBA:
+            out = np.empty(arr.shape, dtype=lut.dtype)
+            _gather_codes(arr, lut, out)
+        else:
+            out = lut[arr]
+        return out, is_ascii
+
+    def image_to_ascii(self, image_path, width_scale=None, height_scale=None, char_set=None, invert=None, brightness=None, crop_enabled=None, crop_start_x=None, crop_start_y=None, crop_end_x=None, crop_end_y=None):
+        """Convert image to ASCII art"""
+        if not os.path.exists(image_path):
+            return "Please select a valid image file."
+
+        try:
+            matrix, is_bytes = self._ascii_matrix(
+                image_path, width_scale, height_scale, char_set, invert, brightness, crop_enabled, crop_start_x, crop_start_y, crop_end_x, crop_end_y)
+            if is_bytes:
+                # Copy the rows into a reused buffer whose extra column is
+                # prefilled with newlines; one decode replaces the per-row
+                # join and its H intermediate bytes objects. The lock keeps
+                # the two pool workers from interleaving writes.
+                h, w = matrix.shape
+                with self._out_buf_lock:
+                    buf = self._out_buf
+                    if buf is None or buf.shape != (h, w + 1):
+                        buf = self._out_buf = np.empty((h, w + 1), dtype=np.uint8)
+                        buf[:, w] = 0x0A
+                    buf[:, :w] = matrix
+                    return buf.reshape(-1)[:-1].tobytes().decode('ascii')
+            rows = matrix.view(f'<U{matrix.shape[1]}').ravel().tolist()
+            return "\n".join(rows)
+
         except Exception as e:
             return f"Error converting image: {str(e)}"
-            
+
+    def image_to_ascii_stream(self, image_path, fh, **kwargs):
+        """Write ASCII art for an image to an open binary file handle.
+
+        Streams one encoded row at a time so huge conversions never build
+        the full text in memory. Accepts the same keyword arguments as
+        image_to_ascii.
+        """
+        matrix, is_bytes = self._ascii_matrix(image_path, **kwargs)
+        for i in range(matrix.shape[0]):
+            if i:
+                fh.write(b'\n')
+            if is_bytes:
+                fh.write(matrix[i].tobytes())
+            else:
+                fh.write(matrix[i].tobytes().decode('utf-32-le').encode('utf-8'))
+
     def open_preview_window(self):
         """Open ASCII art preview in a separate window"""
         if not self.image_path.get():
@@ -511,25 +669,22 @@ class ImageToASCII:
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Status label
-        status_label = ttk.Label(main_frame, text="Processing image... Please wait.")
+        status_label = ttk.Label(main_frame, text="Processing image... Please wait. | Hold Ctrl + Scroll to change font size | Click 'Drag' button to enable drag-to-crop")
         status_label.pack(pady=(0, 10))
         
-        # Force GUI update
-        preview_window.update()
-        
-        # Generate ASCII art
-        ascii_art = self.image_to_ascii(self.image_path.get())
-        
-        # Update status
-        status_label.config(text="ASCII Art Preview - Hold Ctrl + Scroll to change font size | Click 'Drag' button to enable drag-to-crop")
-        
         # Create text widget for preview with drag-to-crop capability
         text_frame = ttk.Frame(main_frame)
         text_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Create text widget first
-        preview_text = tk.Text(text_frame, wrap=tk.NONE, font=("Courier", self.font_size.get()), 
-                              bg='black', fg='white', insertbackground='white', highlightthickness=0)
+        # Create text widget first. A named Font object lets font-size
+        # changes go through Font.configure, which reuses Tk's cached
+        # metrics instead of re-measuring for a fresh font tuple
+        self._preview_font = tkfont.Font(root=self.root, family="Courier",
+                                         size=self.font_size.get())
+        self._preview_font.metrics()  # Warm the metrics cache
+        preview_text = tk.Text(text_frame, wrap=tk.NONE, font=self._preview_font,
+                              bg='black', fg='white', insertbackground='white', highlightthickness=0,
+                              undo=False, autoseparators=False, maxundo=0)
         scrollbar_v = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=preview_text.yview)
         scrollbar_h = ttk.Scrollbar(text_frame, orient=tk.HORIZONTAL, command=preview_text.xview)
         
@@ -557,26 +712,28 @@ class ImageToASCII:
         preview_text.bind("<B1-Motion>", lambda event: self.update_drag_crop(event, preview_text, status_label))
         preview_text.bind("<ButtonRelease-1>", lambda event: self.end_drag_crop(event, preview_text, status_label))
         
-        # Insert ASCII art
-        self.current_ascii_art = ascii_art
-        
-        # Ensure text widget is in normal state before inserting
-        preview_text.config(state=tk.NORMAL)
-        preview_text.delete(1.0, tk.END)  # Clear any existing content
-        preview_text.insert(1.0, ascii_art)
-        preview_text.config(state=tk.DISABLED)  # Make read-only
-        
-        # Force the text widget to update and display content
-        preview_text.update_idletasks()
-        preview_text.see(1.0)  # Scroll to top
-        
-        # Bind mouse wheel events for scaling
-        preview_text.bind("<Control-MouseWheel>", lambda event: self.scale_with_mouse(event, preview_text, status_label))
+        # The conversion runs on a worker thread (see below); the widget
+        # stays empty until the result arrives. Read-only behaviour comes
+        # from swallowing key presses rather than state=DISABLED, so
+        # updates don't need a NORMAL/DISABLED flip (and its relayout) on
+        # every write. Only the copy chords (Ctrl+C / Ctrl+Insert) pass
+        # through to the class bindings - everything else, including
+        # Tk's editing chords like Ctrl+V/X/H/K/O/T, is blocked, and the
+        # mouse-driven paste/cut virtual events are broken explicitly
+        self.current_ascii_art = ""
+        self._last_preview_lines = None
+        self._last_render_key = None
+        preview_text.bind(
+            "<Key>",
+            lambda event: None if (event.state & 0x4 and event.keysym.lower() in ("c", "insert")) else "break")
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>", "<<Undo>>", "<<Redo>>"):
+            preview_text.bind(sequence, lambda event: "break")
+
+        # Bind the mouse wheel for scaling on the toplevel only; the event
+        # bubbles up from preview_text, so binding there too (or on
+        # self.root) would fire the handler several times per tick
         preview_window.bind("<Control-MouseWheel>", lambda event: self.scale_with_mouse(event, preview_text, status_label))
         
-        # Also bind to the main window for global Ctrl+scroll
-        self.root.bind("<Control-MouseWheel>", lambda event: self.scale_with_mouse(event, preview_text, status_label))
-        
         # Buttons frame
         buttons_frame = ttk.Frame(main_frame)
         buttons_frame.pack(fill=tk.X, pady=(10, 0))
@@ -606,8 +763,8 @@ class ImageToASCII:
         brightness_slider = ttk.Scale(brightness_frame, from_=-100, to=100, variable=self.brightness, 
                                      orient=tk.HORIZONTAL, length=120)
         brightness_slider.pack(side=tk.LEFT, padx=(0, 8))
-        brightness_slider.bind('<Motion>', lambda event: self.update_preview_from_controls(preview_text, status_label))
-        brightness_slider.bind('<ButtonRelease-1>', lambda event: self.update_preview_from_controls(preview_text, status_label))
+        brightness_slider.bind('<Motion>', lambda event: self.schedule_preview_update(preview_text, status_label))
+        brightness_slider.bind('<ButtonRelease-1>', lambda event: self.schedule_preview_update(preview_text, status_label))
         
         # Brightness input field
         brightness_entry = ttk.Entry(brightness_frame, textvariable=self.brightness, width=8, font=("Arial", 9))
@@ -687,13 +844,34 @@ class ImageToASCII:
                   command=preview_window.destroy, width=12).pack(side=tk.LEFT)
         
         self.preview_enabled = True
-        
+
         # Store references for dynamic scaling
         self.current_preview_window = preview_window
         self.current_preview_text = preview_text
         self.current_status_label = status_label
-        self.current_ascii_art = ascii_art
-        
+
+        # Kick off the conversion through the same path control changes
+        # use: it reads the Tk variables on the main thread, hands the
+        # work to the pool, and delivers through the seq/key machinery so
+        # a control change made while this first render is in flight
+        # supersedes it instead of being overwritten by it
+        self.update_preview_from_controls(preview_text, status_label)
+
+    def gather_conversion_params(self):
+        """Snapshot the Tk control values for a worker-thread conversion"""
+        return {
+            "width_scale": self.width_scale.get(),
+            "height_scale": self.height_scale.get(),
+            "char_set": self.char_set.get(),
+            "invert": self.invert_colors.get(),
+            "brightness": self.brightness.get(),
+            "crop_enabled": self.crop_enabled.get(),
+            "crop_start_x": self.crop_start_x.get(),
+            "crop_start_y": self.crop_start_y.get(),
+            "crop_end_x": self.crop_end_x.get(),
+            "crop_end_y": self.crop_end_y.get(),
+        }
+
     def export_as_image_from_preview(self):
         """Export ASCII art from preview window as image"""
         if not hasattr(self, 'current_ascii_art') or not self.current_ascii_art:
@@ -703,24 +881,148 @@ class ImageToASCII:
         # Show export options dialog
         self.show_export_options_dialog(self.current_ascii_art)
         
+    # Full rewrites larger than this many rows are streamed in chunks
+    PREVIEW_CHUNK_ROWS = 256
+
+    def set_preview_text(self, preview_text, new_ascii_art):
+        """Update the preview widget, replacing only the lines that changed.
+
+        Tk's Text rebuilds its internal line structure on a full
+        delete/insert, so when the output has the same line count (the
+        common case for control tweaks) only differing lines are touched.
+        Very large rewrites are streamed in row chunks through idle
+        callbacks so the first screenful appears immediately.
+        """
+        new_lines = new_ascii_art.split('\n')
+        old_lines = self._last_preview_lines
+        self._insert_seq += 1
+
+        if old_lines is not None and len(old_lines) == len(new_lines):
+            self._last_preview_lines = new_lines
+            for i, (old_line, new_line) in enumerate(zip(old_lines, new_lines)):
+                if old_line != new_line:
+                    preview_text.replace(f"{i + 1}.0", f"{i + 1}.end", new_line)
+            return
+
+        if len(new_lines) <= self.PREVIEW_CHUNK_ROWS:
+            self._last_preview_lines = new_lines
+            preview_text.replace(1.0, tk.END, new_ascii_art)
+            return
+
+        # Stream the rewrite: the first chunk lands synchronously, the rest
+        # arrive one idle callback at a time and abort if a newer render
+        # supersedes this one. _last_preview_lines stays None until the
+        # final chunk lands, so an aborted stream leaves the widget marked
+        # as partial and the next update takes the full-rewrite path
+        # instead of diffing against lines that were never inserted
+        self._last_preview_lines = None
+        seq = self._insert_seq
+        chunk = self.PREVIEW_CHUNK_ROWS
+        preview_text.delete(1.0, tk.END)
+
+        def insert_rows(start):
+            if seq != self._insert_seq or not preview_text.winfo_exists():
+                return
+            piece = '\n'.join(new_lines[start:start + chunk])
+            if start:
+                piece = '\n' + piece
+            preview_text.insert(f"{tk.END} - 1 chars", piece)
+            if start + chunk < len(new_lines):
+                self.root.after_idle(lambda: insert_rows(start + chunk))
+            else:
+                self._last_preview_lines = new_lines
+
+        insert_rows(0)
+
+    @contextmanager
+    def batched_var_updates(self):
+        """Suppress scheduled preview updates while several Tk variables
+        change as one logical action, so the burst notifies once at the end"""
+        self._batch_vars = True
+        try:
+            yield
+        finally:
+            self._batch_vars = False
+
+    def schedule_preview_update(self, preview_text, status_label, delay=50):
+        """Coalesce rapid control changes into a single preview update"""
+        if self._batch_vars:
+            return
+        if self._pending_update is not None:
+            self.root.after_cancel(self._pending_update)
+        self._pending_update = self.root.after(
+            delay, lambda: self.run_scheduled_update(preview_text, status_label))
+
+    def run_scheduled_update(self, preview_text, status_label):
+        """Run the debounced preview update"""
+        self._pending_update = None
+        # The delay means the preview window may have been closed since
+        # this was scheduled; touching its widgets would raise TclError
+        if not preview_text.winfo_exists() or not status_label.winfo_exists():
+            return
+        self.update_preview_from_controls(preview_text, status_label)
+
     def update_preview_from_controls(self, preview_text, status_label):
         """Update preview when character set or invert colors changes"""
-        # Update status
+        try:
+            image_path = self.image_path.get()
+            params = self.gather_conversion_params()
+            key = (image_path, os.path.getmtime(image_path),
+                   tuple(sorted(params.items())))
+        except OSError as e:
+            status_label.config(text=f"Error updating: {str(e)}")
+            return
+
+        # Spurious trigger (e.g. a variable re-set to its current value):
+        # the preview already shows exactly this render
+        if key == self._last_render_key:
+            return
+
+        # Update status; no forced update_idletasks here - that painted the
+        # whole window synchronously before any conversion work started
         status_label.config(text="Updating ASCII art...")
-        
-        # Force GUI update
-        self.root.update_idletasks()
-        
-        # Regenerate ASCII art with current settings
+
+        # Reuse a cached render when these exact settings were produced
+        # before; otherwise hand the conversion to the worker pool
         try:
-            new_ascii_art = self.image_to_ascii(self.image_path.get())
+            new_ascii_art = self._ascii_cache.get(key)
+            if new_ascii_art is not None:
+                # Invalidate any render still in flight on the pool, or it
+                # would pass the seq check later and clobber this result
+                self._render_seq += 1
+                self._last_render_key = key
+                self.apply_preview_update(preview_text, status_label, new_ascii_art)
+                return
+
+            # Bump the sequence number so a result that is superseded while
+            # still in flight is dropped instead of overwriting a newer one
+            self._render_seq += 1
+            seq = self._render_seq
+            future = self._executor.submit(lambda: self.image_to_ascii(image_path, **params))
+            future.add_done_callback(
+                lambda f: self.root.after(0, lambda: self.finish_preview_update(
+                    seq, key, f.result(), preview_text, status_label)))
             
+        except Exception as e:
+            status_label.config(text=f"Error updating: {str(e)}")
+
+    def finish_preview_update(self, seq, key, new_ascii_art, preview_text, status_label):
+        """Apply a worker-thread render unless a newer one superseded it"""
+        if seq != self._render_seq or not preview_text.winfo_exists():
+            return
+        self._last_render_key = key
+        if len(self._ascii_cache) >= 32:
+            # Drop the oldest entry to bound memory
+            self._ascii_cache.pop(next(iter(self._ascii_cache)))
+        self._ascii_cache[key] = new_ascii_art
+        self.apply_preview_update(preview_text, status_label, new_ascii_art)
+
+    def apply_preview_update(self, preview_text, status_label, new_ascii_art):
+        """Swap new ASCII art into the preview and refresh the status line"""
+        try:
             # Update preview text
-            preview_text.config(state=tk.NORMAL)
-            preview_text.delete(1.0, tk.END)
-            preview_text.insert(1.0, new_ascii_art)
-            preview_text.config(state=tk.DISABLED)
-            
+            self.set_preview_text(preview_text, new_ascii_art)
+
             # Update stored ASCII art
             self.current_ascii_art = new_ascii_art
             
@@ -744,58 +1046,32 @@ class ImageToASCII:
         try:
             value = float(self.brightness.get())
             if -100 <= value <= 100:
-                # Valid value, update preview
-                self.update_preview_from_controls(preview_text, status_label)
+                # Valid value, update preview (debounced so typing "100"
+                # doesn't trigger a regeneration per keystroke)
+                self.schedule_preview_update(preview_text, status_label)
             else:
-                messagebox.showerror("Invalid Value", "Brightness must be between -100 and 100")
+                # Inline status message instead of a modal dialog: a popup
+                # per invalid keystroke blocks typing in a nested event loop
+                status_label.config(text="Brightness must be between -100 and 100")
                 self.brightness.set(0.0)  # Reset to default
-        except ValueError:
-            messagebox.showerror("Invalid Input", "Please enter a valid number")
+        except (ValueError, tk.TclError):
+            status_label.config(text="Please enter a valid brightness number")
             self.brightness.set(0.0)  # Reset to default
     
     def set_crop_preset(self, preset_type):
         """Set crop coordinates based on preset type"""
-        if preset_type == "center":
-            # Center crop - crop 25% from each side
-            self.crop_start_x.set(25.0)
-            self.crop_start_y.set(25.0)
-            self.crop_end_x.set(75.0)
-            self.crop_end_y.set(75.0)
-        elif preset_type == "top":
-            # Top half
-            self.crop_start_x.set(0.0)
-            self.crop_start_y.set(0.0)
-            self.crop_end_x.set(100.0)
-            self.crop_end_y.set(50.0)
-        elif preset_type == "bottom":
-            # Bottom half
-            self.crop_start_x.set(0.0)
-            self.crop_start_y.set(50.0)
-            self.crop_end_x.set(100.0)
-            self.crop_end_y.set(100.0)
-        elif preset_type == "left":
-            # Left half
-            self.crop_start_x.set(0.0)
-            self.crop_start_y.set(0.0)
-            self.crop_end_x.set(50.0)
-            self.crop_end_y.set(100.0)
-        elif preset_type == "right":
-            # Right half
-            self.crop_start_x.set(50.0)
-            self.crop_start_y.set(0.0)
-            self.crop_end_x.set(100.0)
-            self.crop_end_y.set(100.0)
-        elif preset_type == "reset":
-            # Reset to full image
-            self.crop_start_x.set(0.0)
-            self.crop_start_y.set(0.0)
-            self.crop_end_x.set(100.0)
-            self.crop_end_y.set(100.0)
+        start_x, start_y, end_x, end_y = CROP_PRESETS.get(
+            preset_type, CROP_PRESETS["reset"])
+        with self.batched_var_updates():
+            self.crop_start_x.set(start_x)
+            self.crop_start_y.set(start_y)
+            self.crop_end_x.set(end_x)
+            self.crop_end_y.set(end_y)
         
         # Update preview if cropping is enabled
         if self.crop_enabled.get():
             if hasattr(self, 'current_preview_text') and hasattr(self, 'current_status_label'):
-                self.update_preview_from_controls(self.current_preview_text, self.current_status_label)
+                self.schedule_preview_update(self.current_preview_text, self.current_status_label)
     
     def on_crop_entry_change(self, preview_text, status_label):
         """Handle crop coordinate entry field changes"""
@@ -809,22 +1085,22 @@ class ImageToASCII:
             # Validate ranges
             if not (0 <= start_x <= 100 and 0 <= start_y <= 100 and 
                     0 <= end_x <= 100 and 0 <= end_y <= 100):
-                messagebox.showerror("Invalid Value", "Crop coordinates must be between 0 and 100")
+                status_label.config(text="Crop coordinates must be between 0 and 100")
                 self.reset_crop_to_default()
                 return
             
             # Validate that end coordinates are greater than start coordinates
             if start_x >= end_x or start_y >= end_y:
-                messagebox.showerror("Invalid Value", "End coordinates must be greater than start coordinates")
+                status_label.config(text="End coordinates must be greater than start coordinates")
                 self.reset_crop_to_default()
                 return
             
             # Valid values, update preview if cropping is enabled
             if self.crop_enabled.get():
-                self.update_preview_from_controls(preview_text, status_label)
+                self.schedule_preview_update(preview_text, status_label)
                 
-        except ValueError:
-            messagebox.showerror("Invalid Input", "Please enter valid numbers for crop coordinates")
+        except (ValueError, tk.TclError):
+            status_label.config(text="Please enter valid numbers for crop coordinates")
             self.reset_crop_to_default()
     
     def reset_crop_to_default(self):
@@ -1008,39 +1284,73 @@ class ImageToASCII:
         current_font_size = self.font_size.get()
         new_font_size = current_font_size + font_change
         
-        # Clamp to valid range (2 to 20)
+        # Clamp to valid range (2 to 20); nothing to do if the clamp left
+        # the size unchanged
         new_font_size = max(2, min(20, new_font_size))
-        
+        if new_font_size == current_font_size:
+            return
+
         # Update font size variable
         self.font_size.set(new_font_size)
-        
-        # Update preview text font
-        preview_text.config(font=("Courier", new_font_size))
-        
-        # Update status
+
+        # Update preview text font through the shared Font object
+        self._preview_font.configure(size=new_font_size)
+
+        # Debounce the status rebuild so a fast wheel stream doesn't flood
+        # Tk with label reconfigures
+        if self._status_job is not None:
+            self.root.after_cancel(self._status_job)
+        self._status_job = self.root.after(
+            50, lambda: self.update_font_status(status_label, new_font_size))
+
+    def update_font_status(self, status_label, font_size):
+        """Refresh the status line after a font-size change"""
+        self._status_job = None
+
         char_set_name = self.char_set.get()
         invert_status = "Inverted" if self.invert_colors.get() else "Normal"
         brightness_value = self.brightness.get()
-        
+
         # Add crop information to status
         crop_info = ""
         if self.crop_enabled.get():
             crop_info = f" | Cropped: {self.crop_start_x.get():.0f}%,{self.crop_start_y.get():.0f}% to {self.crop_end_x.get():.0f}%,{self.crop_end_y.get():.0f}%"
-        
-        status_label.config(text=f"ASCII Art Preview - {char_set_name} ({invert_status}) Brightness: {brightness_value:.0f} Font: {new_font_size}{crop_info}")
-        
+
+        status_label.config(text=f"ASCII Art Preview - {char_set_name} ({invert_status}) Brightness: {brightness_value:.0f} Font: {font_size}{crop_info}")
+
     def copy_to_clipboard_dynamic(self):
         """Copy current ASCII art to clipboard"""
-        if hasattr(self, 'current_ascii_art'):
-            self.root.clipboard_clear()
-            self.root.clipboard_append(self.current_ascii_art)
-            messagebox.showinfo("Success", "ASCII art copied to clipboard!")
-        else:
+        if not getattr(self, 'current_ascii_art', ''):
             messagebox.showerror("Error", "No ASCII art to copy.")
+            return
+
+        text = self.current_ascii_art
+        self.root.clipboard_clear()
+        if hasattr(self, 'current_status_label'):
+            self.current_status_label.config(text="Copying to clipboard...")
+
+        # Append in ~64KB chunks, one per after(0) callback, so a multi-MB
+        # string doesn't stall the event loop inside a single Tcl call.
+        # The sequence id cancels a chain still running from an earlier
+        # click, which would otherwise interleave its appends with ours
+        chunk_size = 65536
+        self._copy_seq += 1
+        seq = self._copy_seq
+
+        def append_chunk(pos=0):
+            if seq != self._copy_seq:
+                return
+            if pos < len(text):
+                self.root.clipboard_append(text[pos:pos + chunk_size])
+                self.root.after(0, lambda: append_chunk(pos + chunk_size))
+            else:
+                messagebox.showinfo("Success", "ASCII art copied to clipboard!")
+
+        append_chunk()
             
     def save_ascii_from_preview_dynamic(self):
         """Save current ASCII art from preview window"""
-        if not hasattr(self, 'current_ascii_art'):
+        if not getattr(self, 'current_ascii_art', ''):
             messagebox.showerror("Error", "No ASCII art to save.")
             return
             
@@ -1049,15 +1359,25 @@ class ImageToASCII:
             defaultextension=".txt",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
         )
-        
-        if filename:
+
+        if not filename:
+            return
+
+        # Encode once and write on the worker pool so a large file write
+        # doesn't block the event loop; dialogs come back via root.after
+        data = self.current_ascii_art.encode('utf-8')
+
+        def write_file():
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.current_ascii_art)
-                messagebox.showinfo("Success", f"ASCII art saved to {filename}")
+                with open(filename, 'wb') as f:
+                    f.write(data)
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file: {str(e)}")
-        
+                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to save file: {str(e)}"))
+            else:
+                self.root.after(0, lambda: messagebox.showinfo("Success", f"ASCII art saved to {filename}"))
+
+        self._executor.submit(write_file)
+
     def copy_to_clipboard(self, text):
         """Copy text to clipboard"""
         self.root.clipboard_clear()